@@ -1,6 +1,10 @@
 # Creator And Developer : Copy
 
-import sys, os, json, socket, struct, time
+import sys, os, json, socket, struct, time, threading, queue, hashlib, bisect, heapq, argparse, multiprocessing, selectors, zlib, math, csv, io, html
+import ipaddress, secrets, signal
+from array import array
+from collections import deque
+from multiprocessing.connection import Listener, Client, deliver_challenge, answer_challenge
 from datetime import datetime
 from PyQt5 import QtCore, QtGui, QtWidgets
 
@@ -9,7 +13,34 @@ CONFIG_FILE = os.path.join(os.path.expanduser("~"), ".rosemc_deluxe_cfg.json")
 FONT_FILES = ["Minecraftia.ttf", "PressStart2P.ttf", "Minecraft.ttf"]  
 VALID_USER = "Mctools"
 VALID_PASS = "free"
-HISTORY_LIMIT = 300
+HISTORY_LIMIT = 50000
+EVENT_LOG_FILE = os.path.join(os.path.expanduser("~"), ".rosemc_events.jsonl")
+EVENT_LOG_MAX_BYTES = 2 * 1024 * 1024
+EVENT_LOG_BACKUPS = 3
+LOG_VIEW_LIMIT = 500
+AUTO_MAX_INFLIGHT = 16
+AUTO_TICK_MS = 200
+AUTO_EDIT_DELAY = 2.0
+FLEET_LISTEN = "127.0.0.1:25590"
+FLEET_AUTHKEY = "rosemc-fleet"
+FLEET_BEAT_INTERVAL = 2.0
+FLEET_HELLO_TIMEOUT = 10.0
+FLEET_MAX_MESSAGE = 4 * 1024 * 1024
+FLEET_DEAD_AFTER = 15.0
+FLEET_WORKER_THREADS = 32
+RING_REPLICAS = 64
+FINGERPRINT_FILE = os.path.join(os.path.expanduser("~"), ".rosemc_fingerprints.json")
+PROBE_PROTOCOLS = {47: "1.8.x", 340: "1.12.2", 498: "1.14.4", 754: "1.16.5", 758: "1.18.2",
+                   763: "1.20.1", 765: "1.20.4", 767: "1.21.1", 769: "1.21.4"}
+REPORT_STATE_FILE = os.path.join(os.path.expanduser("~"), ".rosemc_report_state.json")
+REPORT_DIR = os.path.join(os.path.expanduser("~"), "rosemc_reports")
+REPORT_PERIOD_HOURS = 24 * 7
+PING_BUCKET_GROWTH = 1.05
+PING_BUCKETS = 200
+SOFTWARE_MARKERS = [("velocity", "Velocity"), ("waterfall", "Waterfall"), ("bungeecord", "BungeeCord"),
+                    ("folia", "Folia"), ("purpur", "Purpur"), ("pufferfish", "Pufferfish"), ("paper", "Paper"),
+                    ("spigot", "Spigot"), ("craftbukkit", "CraftBukkit"), ("mohist", "Mohist"), ("arclight", "Arclight"),
+                    ("neoforge", "NeoForge"), ("forge", "Forge"), ("quilt", "Quilt"), ("fabric", "Fabric")]
 
 
 def load_config():
@@ -26,6 +57,99 @@ def save_config(cfg):
     except Exception as e:
         print("save_config error:", e)
 
+def fleet_authkey(cfg) -> str:
+    """Per-install fleet secret, generated on first use. Copy it to other nodes (or pass --authkey)."""
+    if not cfg.get("fleet_authkey"):
+        cfg["fleet_authkey"] = secrets.token_hex(16)
+        save_config(cfg)
+    return cfg["fleet_authkey"]
+
+
+class EventLog:
+    """Structured event log written as rotating JSON lines.
+
+    emit() only puts the record on a queue; a background thread drains the
+    queue in batches so callers never wait on disk I/O. The last `keep` records
+    also stay in a ring that the GUI log pane renders from."""
+
+    def __init__(self, path=EVENT_LOG_FILE, max_bytes=EVENT_LOG_MAX_BYTES, backups=EVENT_LOG_BACKUPS, keep=LOG_VIEW_LIMIT):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.recent = deque(maxlen=keep)
+        self._seq = 0
+        self._lock = threading.Lock()
+        self._q = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="rosemc-events", daemon=True)
+        self._thread.start()
+
+    def emit(self, event: str, **fields) -> dict:
+        rec = {"ts": time.time(), "event": event}
+        rec.update(fields)
+        with self._lock:
+            self._seq += 1
+            self.recent.append((self._seq, rec))
+        self._q.put(rec)
+        return rec
+
+    def since(self, seq: int):
+        """Records newer than `seq` still in the ring, as (last_seq, [records])."""
+        with self._lock:
+            out = []
+            for s, rec in reversed(self.recent):
+                if s <= seq:
+                    break
+                out.append(rec)
+            return self._seq, out[::-1]
+
+    def close(self, timeout=2.0):
+        self._q.put(None)
+        self._thread.join(timeout)
+
+    def _run(self):
+        running = True
+        while running:
+            batch = [self._q.get()]
+            while len(batch) < 1000:
+                try:
+                    batch.append(self._q.get_nowait())
+                except queue.Empty:
+                    break
+            if None in batch:
+                running = False
+                batch = [r for r in batch if r is not None]
+            if batch:
+                self._write(batch)
+
+    def _write(self, batch):
+        try:
+            self._rotate_if_needed()
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("".join(json.dumps(r, ensure_ascii=False, default=str) + "\n" for r in batch))
+        except Exception as e:
+            print("event log error:", e)
+
+    def _rotate_if_needed(self):
+        try:
+            if os.path.getsize(self.path) < self.max_bytes:
+                return
+        except OSError:
+            return
+        for i in range(self.backups - 1, 0, -1):
+            src = f"{self.path}.{i}"
+            if os.path.exists(src):
+                os.replace(src, f"{self.path}.{i + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+
+def format_event(rec: dict) -> str:
+    """One log pane line for an event record."""
+    when = datetime.fromtimestamp(rec["ts"]).strftime('%H:%M:%S')
+    if "msg" in rec:
+        return f"[{when}] {rec['msg']}"
+    fields = " ".join(f"{k}={v}" for k, v in rec.items() if k not in ("ts", "event") and v is not None)
+    return f"[{when}] {rec['event']} {fields}"
+
 
 def write_varint(value: int) -> bytes:
     out = bytearray()
@@ -76,52 +200,390 @@ def read_varint_from_sock(sock: socket.socket, timeout=4.0) -> int:
             break
     return result
 
-def query_java(host: str, port: int, timeout: float = 5.0) -> dict:
-
-    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    s.settimeout(timeout)
-    start = time.time()
-    s.connect((host, port))
-    s.sendall(build_status_request(host, port))
+def build_ping_packet(payload: int) -> bytes:
+    body = write_varint(0x01) + struct.pack(">q", payload)
+    return write_varint(len(body)) + body
 
-    length = read_varint_from_sock(s, timeout)
-    _packet_id = read_varint_from_sock(s, timeout)
-    str_len = read_varint_from_sock(s, timeout)
+def recv_exact(sock: socket.socket, n: int) -> bytes:
     data = b''
-    while len(data) < str_len:
-        chunk = s.recv(str_len - len(data))
+    while len(data) < n:
+        chunk = sock.recv(n - len(data))
         if not chunk:
-            raise EOFError("EOF reading JSON")
+            raise EOFError("socket closed")
         data += chunk
-    s.close()
-    elapsed = int((time.time() - start) * 1000)
-    text = data.decode("utf-8", errors="replace")
-    out = {"success": True, "type": "java", "ping": elapsed, "raw": text}
+    return data
+
+def sample_pings(sock: socket.socket, count: int, timeout: float = 4.0) -> list:
+    """Ping `count` times on an already open status connection, one at a time:
+    each ping is sent only after the previous pong arrived, so every sample is
+    a single round trip. Returns the RTTs (ms) of the pongs received."""
+    rtts = []
     try:
-        j = json.loads(text)
-        desc = j.get("description")
-        if isinstance(desc, str):
-            motd = desc
-        elif isinstance(desc, dict):
-            motd = desc.get("text","")
-            if not motd:
-                extra = desc.get("extra", [])
-                motd = "".join((e.get("text","") if isinstance(e,dict) else str(e)) for e in extra)
+        for i in range(count):
+            sent = time.perf_counter()
+            sock.sendall(build_ping_packet(i))
+            while True:
+                length = read_varint_from_sock(sock, timeout)
+                body = recv_exact(sock, length)
+                if body[:1] == b"\x01" and len(body) >= 9 and struct.unpack(">q", body[1:9])[0] == i:
+                    break
+            rtts.append(round((time.perf_counter() - sent) * 1000, 2))
+    except (OSError, EOFError, ValueError):
+        # vanilla servers close the connection after the first pong
+        pass
+    return rtts
+
+def ping_stats(rtts: list) -> dict:
+    """min/avg/jitter over the samples; jitter is None when there is only one pong."""
+    if not rtts:
+        return {}
+    jitter = None
+    if len(rtts) > 1:
+        jitter = round(sum(abs(b - a) for a, b in zip(rtts, rtts[1:])) / (len(rtts) - 1), 2)
+    return {
+        "ping_samples": rtts,
+        "ping_min": min(rtts),
+        "ping_avg": round(sum(rtts) / len(rtts), 2),
+        "ping_jitter": jitter,
+    }
+
+def format_jitter(jitter) -> str:
+    return "n/a (only one pong received)" if jitter is None else f"{jitter} ms"
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class ServerResult:
+    """One check result, kept small enough to hold for thousands of servers.
+
+    Fields live in slots, repeated strings (host, version, player names) are
+    interned, the raw status JSON is zlib-compressed (minus the favicon, which
+    is kept only as a hash and length) and ping samples sit in a float array.
+    to_dict() rebuilds the classic result dict for export/copy."""
+
+    __slots__ = ("host", "success", "type", "ping", "samples", "motd", "version", "protocol",
+                 "players_online", "players_max", "sample", "_raw", "favicon_hash", "favicon_len", "parse_error",
+                 "error", "error_class", "elapsed_ms", "ts", "worker")
+
+    def __init__(self, host="", success=False):
+        self.host = _intern(host)
+        self.success = success
+        self.type = "java"
+        self.ping = None
+        self.samples = None
+        self.motd = ""
+        self.version = ""
+        self.protocol = None
+        self.players_online = None
+        self.players_max = None
+        self.sample = ()
+        self._raw = b""
+        self.favicon_hash = None
+        self.favicon_len = None
+        self.parse_error = None
+        self.error = None
+        self.error_class = None
+        self.elapsed_ms = None
+        self.ts = None
+        self.worker = None
+
+    @classmethod
+    def from_status(cls, ping: int, text: str, rtts=()):
+        r = cls(success=True)
+        r.ping = ping
+        r.raw = text
+        if rtts:
+            r.samples = array("f", rtts)
+        try:
+            j = json.loads(text)
+            favicon = j.pop("favicon", None) if isinstance(j, dict) else None
+            if isinstance(favicon, str):
+                # base64 PNG barely compresses; keep a fingerprint of it, not the data
+                r.favicon_hash = hashlib.sha1(favicon.encode("utf-8")).hexdigest()
+                r.favicon_len = len(favicon)
+                r.raw = json.dumps(j, ensure_ascii=False)
+            desc = j.get("description")
+            if isinstance(desc, str):
+                motd = desc
+            elif isinstance(desc, dict):
+                motd = desc.get("text","")
+                if not motd:
+                    extra = desc.get("extra", [])
+                    motd = "".join((e.get("text","") if isinstance(e,dict) else str(e)) for e in extra)
+            else:
+                motd = str(desc)
+            r.motd = motd
+            r.version = _intern(j.get("version",{}).get("name",""))
+            r.protocol = j.get("version",{}).get("protocol", None)
+            r.players_online = j.get("players",{}).get("online", None)
+            r.players_max = j.get("players",{}).get("max", None)
+            r.sample = tuple(_intern(p.get("name")) for p in j.get("players",{}).get("sample",[]) if isinstance(p,dict))
+        except Exception as e:
+            r.parse_error = str(e)
+        return r
+
+    @classmethod
+    def failure(cls, host: str, exc: Exception):
+        r = cls(host)
+        r.error = str(exc)
+        r.error_class = _intern(type(exc).__name__)
+        return r
+
+    @property
+    def raw(self) -> str:
+        return zlib.decompress(self._raw).decode("utf-8") if self._raw else ""
+
+    @raw.setter
+    def raw(self, text: str):
+        self._raw = zlib.compress(text.encode("utf-8")) if text else b""
+
+    @property
+    def ping_samples(self) -> list:
+        return [round(v, 2) for v in self.samples] if self.samples else []
+
+    def ping_stats(self) -> dict:
+        return ping_stats(self.ping_samples)
+
+    @classmethod
+    def from_dict(cls, d: dict):
+        """Rebuild a result from to_dict() output (e.g. received from a fleet worker)."""
+        def num(v):
+            return v if isinstance(v, (int, float)) and not isinstance(v, bool) else None
+        def text(v):
+            return v if isinstance(v, str) else ""
+        r = cls(text(d.get("_host")), d.get("success") is True)
+        r.elapsed_ms = num(d.get("_elapsed_ms"))
+        if not r.success:
+            r.error = text(d.get("error"))
+            r.error_class = _intern(text(d.get("error_class")) or "Error")
+            return r
+        r.type = _intern(text(d.get("type")) or "java")
+        r.ping = num(d.get("ping"))
+        r.raw = text(d.get("raw"))
+        if d.get("favicon_hash"):
+            r.favicon_hash = text(d.get("favicon_hash"))
+            r.favicon_len = num(d.get("favicon_len"))
+        samples = [v for v in d.get("ping_samples") or [] if num(v) is not None]
+        if samples:
+            r.samples = array("f", samples)
+        if "parse_error" in d:
+            r.parse_error = text(d.get("parse_error"))
+        r.motd = text(d.get("motd"))
+        r.version = _intern(text(d.get("version")))
+        r.protocol = num(d.get("protocol"))
+        r.players_online = num(d.get("players_online"))
+        r.players_max = num(d.get("players_max"))
+        r.sample = tuple(_intern(n) for n in d.get("sample") or [] if isinstance(n, str))
+        return r
+
+    def to_dict(self) -> dict:
+        if not self.success:
+            out = {"success": False, "error": self.error, "error_class": self.error_class}
         else:
-            motd = str(desc)
-        out.update({
-            "motd": motd,
-            "version": j.get("version",{}).get("name",""),
-            "protocol": j.get("version",{}).get("protocol", None),
-            "players_online": j.get("players",{}).get("online", None),
-            "players_max": j.get("players",{}).get("max", None),
-            "sample": [p.get("name") for p in j.get("players",{}).get("sample",[]) if isinstance(p,dict)]
-        })
-    except Exception as e:
-        out["parse_error"] = str(e)
+            out = {"success": True, "type": self.type, "ping": self.ping, "raw": self.raw}
+            if self.favicon_hash:
+                out.update({"favicon_hash": self.favicon_hash, "favicon_len": self.favicon_len})
+            out.update(self.ping_stats())
+            if self.parse_error is not None:
+                out["parse_error"] = self.parse_error
+            else:
+                out.update({"motd": self.motd, "version": self.version, "protocol": self.protocol,
+                            "players_online": self.players_online, "players_max": self.players_max,
+                            "sample": list(self.sample)})
+        out["_host"] = self.host
+        if self.elapsed_ms is not None:
+            out["_elapsed_ms"] = self.elapsed_ms
+        if self.ts is not None:
+            out["_ts"] = self.ts
+        if self.worker:
+            out["_worker"] = self.worker
+        return out
+
+
+def query_java(host: str, port: int, timeout: float = 5.0, ping_samples: int = 0) -> ServerResult:
+
+    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    s.settimeout(timeout)
+    if ping_samples > 0:
+        s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    start = time.time()
+    try:
+        s.connect((host, port))
+        s.sendall(build_status_request(host, port))
+
+        length = read_varint_from_sock(s, timeout)
+        _packet_id = read_varint_from_sock(s, timeout)
+        str_len = read_varint_from_sock(s, timeout)
+        data = recv_exact(s, str_len)
+        elapsed = int((time.time() - start) * 1000)
+        rtts = sample_pings(s, ping_samples, timeout) if ping_samples > 0 else []
+    finally:
+        s.close()
+    return ServerResult.from_status(elapsed, data.decode("utf-8", errors="replace"), rtts)
+
+def read_varint_from_bytes(buf: bytes, pos: int = 0):
+    """Decode a VarInt at pos; returns (value, next_pos) or None if buf is incomplete."""
+    result = 0
+    for i in range(5):
+        if pos + i >= len(buf):
+            return None
+        val = buf[pos + i]
+        result |= (val & 0x7F) << (7 * i)
+        if (val & 0x80) == 0:
+            return result, pos + i + 1
+    raise ValueError("VarInt too big")
+
+def _parse_status_frame(buf: bytes):
+    head = read_varint_from_bytes(buf)
+    if head is None or len(buf) < head[1] + head[0]:
+        return None
+    _packet_id, pos = read_varint_from_bytes(buf, head[1])
+    str_len, pos = read_varint_from_bytes(buf, pos)
+    return json.loads(buf[pos:pos + str_len].decode("utf-8", errors="replace"))
+
+def probe_protocols(host: str, port: int, protocols, timeout: float = 5.0) -> dict:
+    """Status-handshake the server once per protocol number, all connections in flight
+    at the same time. Returns {protocol: status JSON or None}."""
+    protocols = list(protocols)
+    out = {p: None for p in protocols}
+    sockaddr = socket.getaddrinfo(host, port, socket.AF_INET, socket.SOCK_STREAM)[0][4]
+    sel = selectors.DefaultSelector()
+    for p in protocols:
+        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        s.setblocking(False)
+        s.connect_ex(sockaddr)
+        sel.register(s, selectors.EVENT_WRITE, {"proto": p, "buf": b""})
+    deadline = time.time() + timeout
+    try:
+        while sel.get_map() and time.time() < deadline:
+            for key, mask in sel.select(max(0.0, deadline - time.time())):
+                s, st = key.fileobj, key.data
+                try:
+                    if mask & selectors.EVENT_WRITE:
+                        s.sendall(build_status_request(host, port, st["proto"]))
+                        sel.modify(s, selectors.EVENT_READ, st)
+                        continue
+                    chunk = s.recv(65536)
+                    if not chunk:
+                        raise EOFError("socket closed")
+                    st["buf"] += chunk
+                    j = _parse_status_frame(st["buf"])
+                    if j is None:
+                        continue
+                    out[st["proto"]] = j
+                except Exception:
+                    pass
+                sel.unregister(s)
+                s.close()
+    finally:
+        for key in list(sel.get_map().values()):
+            key.fileobj.close()
+        sel.close()
     return out
 
-def robust_query(addr_text: str, server_type: str, timeout: float, retries: int):
+def _dict_field(status: dict, key: str) -> dict:
+    # status replies are untrusted: "forgeData": null and friends must not raise
+    value = status.get(key)
+    return value if isinstance(value, dict) else {}
+
+def detect_software(status: dict) -> str:
+    if isinstance(status.get("forgeData"), dict):
+        mods = [m.get("modId", "") for m in status["forgeData"].get("mods") or [] if isinstance(m, dict)]
+        return "NeoForge" if "neoforge" in mods else "Forge"
+    if isinstance(status.get("modinfo"), dict):
+        return "Forge (" + str(status["modinfo"].get("type", "FML")) + ")"
+    name = str(_dict_field(status, "version").get("name", "")).lower()
+    for marker, software in SOFTWARE_MARKERS:
+        if marker in name:
+            return software
+    return "Vanilla" if name[:1].isdigit() else "Unknown"
+
+def fingerprint_server(host: str, port: int, timeout: float = 5.0, protocols=PROBE_PROTOCOLS) -> dict:
+    """Detect server software and which of `protocols` the server accepts.
+
+    Proxies and multi-version servers echo the client's protocol back when they
+    support it; anything else answers with its own native protocol."""
+    replies = probe_protocols(host, port, protocols, timeout)
+    answered = {p: j for p, j in replies.items() if j and isinstance(j, dict)}
+    if not answered:
+        raise ConnectionError("no status reply")
+    status = next(iter(answered.values()))
+    version = _dict_field(status, "version")
+    native = {_dict_field(j, "version").get("protocol") for j in answered.values()}
+    accepted = {p for p, j in answered.items() if _dict_field(j, "version").get("protocol") == p}
+    if len(native) == 1 and isinstance(version.get("protocol"), int):
+        accepted.add(version["protocol"])
+    mods = _dict_field(status, "forgeData").get("mods") or _dict_field(status, "modinfo").get("modList") or []
+    if not isinstance(mods, list):
+        mods = []
+    return {
+        "software": detect_software(status),
+        "version": version.get("name", ""),
+        "protocol": version.get("protocol") if len(native) == 1 else None,
+        "accepted": sorted(accepted),
+        "echoes": len(native) > 1,
+        "mods": len(mods),
+        "checked_at": time.time(),
+    }
+
+
+class Fingerprinter:
+    """Fingerprint cache keyed by host:port. A cheap status ping decides whether
+    the cached fingerprint is still good: it is reused until version.name changes."""
+
+    def __init__(self, path=FINGERPRINT_FILE):
+        self.path = path
+        self.cache = {}
+        try:
+            if path and os.path.exists(path):
+                self.cache = json.load(open(path, "r", encoding="utf-8"))
+        except Exception:
+            self.cache = {}
+
+    def save(self):
+        try:
+            json.dump(self.cache, open(self.path, "w", encoding="utf-8"), ensure_ascii=False, indent=1)
+        except Exception as e:
+            print("fingerprint cache error:", e)
+
+    def fingerprint(self, addr_text: str, timeout: float = 5.0) -> dict:
+        key = normalize_addr(addr_text)
+        host, port = key.rsplit(":", 1)
+        cached = self.cache.get(key)
+        if cached:
+            current = query_java(host, int(port), timeout)
+            if current.version == cached.get("version"):
+                return cached
+        fp = fingerprint_server(host, int(port), timeout)
+        fp["_host"] = key
+        self.cache[key] = fp
+        return fp
+
+def version_matrix(fingerprints) -> dict:
+    """Aggregate fingerprints into {"protocols": [...], "rows": [...]}; one row per
+    (software, version) with the server count and how many accept each protocol."""
+    fingerprints = list(fingerprints)
+    protocols = sorted(set(PROBE_PROTOCOLS).union(*(fp.get("accepted", []) for fp in fingerprints)))
+    rows = {}
+    for fp in fingerprints:
+        key = (fp.get("software", "Unknown"), fp.get("version", ""))
+        row = rows.setdefault(key, {"software": key[0], "version": key[1], "servers": 0,
+                                    "accepts": {p: 0 for p in protocols}})
+        row["servers"] += 1
+        for p in fp.get("accepted", []):
+            row["accepts"][p] += 1
+    return {"protocols": protocols, "rows": sorted(rows.values(), key=lambda r: (-r["servers"], r["software"], r["version"]))}
+
+def format_version_matrix(matrix: dict) -> str:
+    protos = matrix["protocols"]
+    header = ["Software", "Version", "Servers"] + [PROBE_PROTOCOLS.get(p, str(p)) for p in protos]
+    lines = ["\t".join(header)]
+    for r in matrix["rows"]:
+        lines.append("\t".join([r["software"], r["version"], str(r["servers"])] + [str(r["accepts"][p]) for p in protos]))
+    return "\n".join(lines)
+
+def robust_query(addr_text: str, server_type: str, timeout: float, retries: int, ping_samples: int = 0):
     """Parse addr_text (host[:port]) then query with retries."""
     if ":" in addr_text:
         host, port_s = addr_text.split(":",1)
@@ -137,40 +599,948 @@ def robust_query(addr_text: str, server_type: str, timeout: float, retries: int)
     while attempt <= retries:
         try:
 
-            return query_java(host, port, timeout)
+            return query_java(host, port, timeout, ping_samples)
         except Exception as e:
             last_exc = e
             attempt += 1
-            time.sleep(0.4 * attempt)
+            if attempt <= retries:
+                time.sleep(0.4 * attempt)
     raise last_exc if last_exc else RuntimeError("Query failed")
 
+def normalize_addr(addr_text: str) -> str:
+    """Canonical "host:port" key: lower-case host, default port 25565; "" if there is no host."""
+    addr_text = addr_text.strip()
+    if ":" in addr_text:
+        host, port_s = addr_text.split(":",1)
+        try:
+            port = int(port_s)
+        except:
+            port = 25565
+    else:
+        host = addr_text
+        port = 25565
+    host = host.strip()
+    if not host:
+        return ""
+    return f"{host.lower()}:{port}"
+
+def check_server(addr_text: str, server_type: str='auto', timeout: float=5, retries: int=1, ping_samples: int=0) -> ServerResult:
+    """robust_query that never raises; failures come back with success=False."""
+    host = normalize_addr(addr_text)
+    start = time.perf_counter()
+    try:
+        res = robust_query(addr_text.strip(), server_type, timeout, retries, ping_samples)
+        res.host = _intern(host)
+    except Exception as e:
+        res = ServerResult.failure(host, e)
+    res.elapsed_ms = int((time.perf_counter() - start) * 1000)
+    return res
+
+class ServerEntry:
+    __slots__ = ("addr", "tags", "group", "notes", "interval")
+
+    def __init__(self, addr: str, tags=(), group: str = "", notes: str = "", interval: int = 0):
+        self.addr = normalize_addr(addr)
+        self.tags = tuple(sorted({t.strip().lstrip("#").lower() for t in tags if t.strip().lstrip("#")}))
+        self.group = group.strip()
+        self.notes = notes
+        self.interval = int(interval or 0)
+
+    @classmethod
+    def from_config(cls, item):
+        if isinstance(item, str):
+            return cls(item)
+        tags = item.get("tags") or ()
+        if isinstance(tags, str):
+            tags = [tags]
+        return cls(item.get("addr", ""), tags, item.get("group", ""), item.get("notes", ""),
+                   item.get("interval", 0))
+
+    def to_config(self):
+        # plain entries stay plain strings so older configs and versions keep working
+        if not (self.tags or self.group or self.notes or self.interval):
+            return self.addr
+        out = {"addr": self.addr, "tags": list(self.tags), "group": self.group, "notes": self.notes}
+        if self.interval:
+            out["interval"] = self.interval
+        return out
+
+    def label(self) -> str:
+        parts = [self.addr]
+        if self.group:
+            parts.append(f"[{self.group}]")
+        parts += ["#" + t for t in self.tags]
+        return "  ".join(parts)
+
+
+class ServerList:
+    """Saved servers keyed by normalized address, newest first.
+
+    Entries live in an insertion-ordered dict (oldest first, iterated in
+    reverse) so membership, add and remove are O(1). A sorted address list
+    and tag/group maps serve prefix and tag searches without a full scan."""
+
+    def __init__(self, items=()):
+        self._entries = {}
+        self._sorted = []
+        self._tags = {}
+        self._groups = {}
+        for it in reversed(list(items)):
+            self.add(it if isinstance(it, ServerEntry) else ServerEntry.from_config(it))
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, addr):
+        return normalize_addr(addr) in self._entries
+
+    def __iter__(self):
+        return reversed(list(self._entries.values()))
+
+    def addrs(self) -> list:
+        return list(reversed(self._entries))
+
+    def get(self, addr):
+        return self._entries.get(normalize_addr(addr))
+
+    def tags(self) -> list:
+        return sorted(self._tags)
+
+    def add(self, entry: ServerEntry) -> bool:
+        if not entry.addr or entry.addr in self._entries:
+            return False
+        self._entries[entry.addr] = entry
+        bisect.insort(self._sorted, entry.addr)
+        self._index(entry)
+        return True
+
+    def remove(self, addr):
+        entry = self._entries.pop(normalize_addr(addr), None)
+        if entry:
+            self._sorted.pop(bisect.bisect_left(self._sorted, entry.addr))
+            self._unindex(entry)
+        return entry
+
+    def trim(self, limit: int) -> list:
+        """Drop the oldest entries beyond limit and return their addresses."""
+        dropped = []
+        while len(self._entries) > limit:
+            dropped.append(self.remove(next(iter(self._entries))).addr)
+        return dropped
+
+    def clear(self):
+        self.__init__()
+
+    def to_config(self) -> list:
+        return [e.to_config() for e in self]
+
+    def _index(self, entry):
+        for t in entry.tags:
+            self._tags.setdefault(t, set()).add(entry.addr)
+        if entry.group:
+            self._groups.setdefault(entry.group.lower(), set()).add(entry.addr)
+
+    def _unindex(self, entry):
+        for key, index in [(t, self._tags) for t in entry.tags] + [(entry.group.lower(), self._groups)]:
+            bucket = index.get(key)
+            if bucket is not None:
+                bucket.discard(entry.addr)
+                if not bucket:
+                    del index[key]
+
+    @staticmethod
+    def _tokens(query: str) -> list:
+        out = []
+        for tok in query.lower().split():
+            if tok.startswith("#") or tok.startswith("tag:"):
+                out.append(("tag", tok.split(":", 1)[1] if tok.startswith("tag:") else tok[1:]))
+            elif tok.startswith("group:"):
+                out.append(("group", tok[6:]))
+            else:
+                out.append(("addr", tok))
+        return out
+
+    def _lookup(self, kind, prefix) -> set:
+        if kind == "addr":
+            i = bisect.bisect_left(self._sorted, prefix)
+            j = bisect.bisect_left(self._sorted, prefix + "\uffff")
+            return set(self._sorted[i:j])
+        index = self._tags if kind == "tag" else self._groups
+        hits = set()
+        for key in index:
+            if key.startswith(prefix):
+                hits |= index[key]
+        return hits
+
+    @staticmethod
+    def _matches(entry, kind, prefix) -> bool:
+        if kind == "addr":
+            return entry.addr.startswith(prefix)
+        if kind == "tag":
+            return any(t.startswith(prefix) for t in entry.tags)
+        return entry.group.lower().startswith(prefix)
+
+    @classmethod
+    def narrows(cls, old_query: str, new_query: str) -> bool:
+        """True if every hit of new_query is also a hit of old_query."""
+        old, new = cls._tokens(old_query), cls._tokens(new_query)
+        if not old or len(new) < len(old):
+            return False
+        return all(k1 == k2 and p2.startswith(p1) for (k1, p1), (k2, p2) in zip(old, new))
+
+    def search(self, query: str, within=None):
+        """Addresses matching every token of query (host prefix, #tag, group:name).
+
+        Returns None for an empty query. When `within` is the hit set of a query
+        this one extends (the user kept typing), only those entries are checked."""
+        tokens = self._tokens(query)
+        if not tokens:
+            return None
+        if within is not None:
+            return {a for a in within if a in self._entries and
+                    all(self._matches(self._entries[a], k, p) for k, p in tokens)}
+        hits = None
+        for kind, prefix in sorted(tokens, key=lambda t: t[0] != "tag"):
+            found = self._lookup(kind, prefix)
+            hits = found if hits is None else hits & found
+            if not hits:
+                break
+        return hits
+
+
+class PollScheduler:
+    """Auto-refresh scheduler over many servers.
+
+    Due times sit in a heap, so each tick only looks at servers that are due.
+    New servers are staggered across their interval, and a token bucket
+    refilled at the target rate (sum of 1/interval, optionally capped) spreads
+    polls evenly instead of firing them in bursts. A server whose previous
+    poll is still in flight skips that round."""
+
+    def __init__(self, interval: float, max_rate: float = 0, max_inflight: int = AUTO_MAX_INFLIGHT):
+        self.default_interval = interval
+        self.max_rate = max_rate
+        self.max_inflight = max_inflight
+        self.in_flight = set()
+        self.skipped = 0
+        self._heap = []
+        self._intervals = {}
+        self._gen = {}
+        self._seq = 0
+        self._rate = 0.0
+        self._tokens = 1.0
+        self._last_refill = time.monotonic()
+        self._done = deque()
+        self._started = time.monotonic()
+
+    def __len__(self):
+        return len(self._intervals)
+
+    def interval_of(self, addr) -> float:
+        return self._intervals.get(addr) or self.default_interval
+
+    def set_servers(self, servers):
+        """servers: iterable of (addr, interval); interval 0/None means the default."""
+        old = self._intervals
+        self._intervals = {a: iv or 0 for a, iv in servers}
+        for addr in list(self._gen):
+            if addr not in self._intervals:
+                del self._gen[addr]
+        self._recompute_rate()
+        self._stagger([a for a in self._intervals if a not in old or old[a] != self._intervals[a]])
+
+    def set_interval(self, interval: float):
+        self.default_interval = interval
+        self._recompute_rate()
+        self._stagger([a for a, iv in self._intervals.items() if not iv])
+
+    def add(self, addr, interval=0, delay: float = 0.0):
+        """Schedule one server (first poll after delay) without touching the others."""
+        self.discard(addr)
+        self._intervals[addr] = interval or 0
+        self._rate += 1.0 / self.interval_of(addr)
+        self._push(addr, time.monotonic() + delay)
+
+    def discard(self, addr):
+        if addr in self._intervals:
+            self._rate -= 1.0 / self.interval_of(addr)
+            del self._intervals[addr]
+            self._gen.pop(addr, None)
+
+    def _recompute_rate(self):
+        self._rate = sum(1.0 / self.interval_of(a) for a in self._intervals)
+
+    def _stagger(self, addrs):
+        now = time.monotonic()
+        for i, addr in enumerate(addrs):
+            self._push(addr, now + self.interval_of(addr) * i / max(1, len(addrs)))
+
+    def target_rate(self) -> float:
+        rate = max(0.0, self._rate)
+        return min(rate, self.max_rate) if self.max_rate else rate
+
+    def achieved_rate(self, window: float = 10.0) -> float:
+        now = time.monotonic()
+        while self._done and self._done[0] < now - window:
+            self._done.popleft()
+        return len(self._done) / max(1e-9, min(window, now - self._started))
+
+    def take(self) -> list:
+        """Pop every server that is due now, within the token and in-flight budgets."""
+        now = time.monotonic()
+        rate = self.target_rate()
+        self._tokens = min(max(1.0, rate), self._tokens + (now - self._last_refill) * rate)
+        self._last_refill = now
+        out = []
+        while self._heap and self._heap[0][0] <= now:
+            if self._tokens < 1 or len(self.in_flight) >= self.max_inflight:
+                break
+            due, gen, addr = heapq.heappop(self._heap)
+            if self._gen.get(addr) != gen:
+                continue
+            nxt = due + self.interval_of(addr)
+            self._push(addr, nxt if nxt > now else now + self.interval_of(addr))
+            if addr in self.in_flight:
+                self.skipped += 1
+                continue
+            self._tokens -= 1
+            self.in_flight.add(addr)
+            out.append(addr)
+        return out
+
+    def done(self, addr):
+        self.in_flight.discard(addr)
+        self._done.append(time.monotonic())
+
+    def _push(self, addr, due):
+        # superseded heap entries are left in place and skipped on pop; once they
+        # outnumber the live ones (e.g. after interval changes) the heap is rebuilt
+        self._seq += 1
+        self._gen[addr] = self._seq
+        heapq.heappush(self._heap, (due, self._seq, addr))
+        if len(self._heap) > 2 * len(self._intervals) + 64:
+            self._heap = [e for e in self._heap if self._gen.get(e[2]) == e[1]]
+            heapq.heapify(self._heap)
+
+
+def parse_listen(text: str):
+    host, _, port = text.rpartition(":")
+    return (host or "127.0.0.1", int(port))
+
+def is_loopback(host: str) -> bool:
+    try:
+        return ipaddress.ip_address(socket.gethostbyname(host)).is_loopback
+    except (OSError, ValueError):
+        return False
+
+def fleet_send(conn, msg: dict):
+    # JSON only: never unpickle anything that came over the network
+    conn.send_bytes(json.dumps(msg, ensure_ascii=False).encode("utf-8"))
+
+def _abort_conn(conn):
+    # shutdown (not close) is what wakes a thread blocked reading the socket
+    try:
+        s = socket.socket(fileno=os.dup(conn.fileno()))
+        s.shutdown(socket.SHUT_RDWR)
+        s.close()
+    except (OSError, ValueError):
+        pass
+
+def fleet_recv(conn) -> dict:
+    msg = json.loads(conn.recv_bytes(FLEET_MAX_MESSAGE).decode("utf-8"))
+    if not isinstance(msg, dict):
+        raise ValueError("fleet message is not an object")
+    return msg
+
+
+class HashRing:
+    """Consistent hash ring; a node owns the keys between its points and the previous ones."""
+
+    def __init__(self, nodes=(), replicas=RING_REPLICAS):
+        self.replicas = replicas
+        self._points = []
+        self._owners = {}
+        for n in nodes:
+            self.add(n)
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        return int.from_bytes(hashlib.md5(key.encode("utf-8")).digest()[:8], "big")
+
+    @property
+    def nodes(self):
+        return sorted(set(self._owners.values()))
+
+    def add(self, node: str):
+        for i in range(self.replicas):
+            h = self._hash(f"{node}#{i}")
+            if h not in self._owners:
+                bisect.insort(self._points, h)
+            self._owners[h] = node
+
+    def remove(self, node: str):
+        for i in range(self.replicas):
+            h = self._hash(f"{node}#{i}")
+            if self._owners.get(h) == node:
+                del self._owners[h]
+                self._points.pop(bisect.bisect_left(self._points, h))
+
+    def node_for(self, key: str):
+        if not self._points:
+            return None
+        i = bisect.bisect(self._points, self._hash(key)) % len(self._points)
+        return self._owners[self._points[i]]
+
+    def shard(self, keys) -> dict:
+        out = {n: [] for n in self.nodes}
+        for k in keys:
+            n = self.node_for(k)
+            if n is not None:
+                out[n].append(k)
+        return out
+
+
+class ResultStore:
+    """Latest result per server, shared by local checks and fleet workers."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._results = {}
+        self._listeners = []
+        self.version = 0
+
+    def subscribe(self, fn):
+        """Call fn(result) for every result put into the store, from the putting thread."""
+        self._listeners.append(fn)
+
+    def put(self, res: ServerResult, worker: str = None):
+        res.ts = time.time()
+        if worker:
+            res.worker = _intern(worker)
+        with self._lock:
+            self._results[res.host] = res
+            self.version += 1
+        for fn in self._listeners:
+            fn(res)
+
+    def get(self, host: str):
+        with self._lock:
+            return self._results.get(host)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return dict(self._results)
+
+
+class PingHistogram:
+    """Log-bucketed ping histogram (HDR style): fixed size, ~5% relative error on percentiles."""
+
+    __slots__ = ("counts",)
+    _log_growth = math.log(PING_BUCKET_GROWTH)
+
+    def __init__(self, counts=None):
+        self.counts = array("I", counts or [0] * PING_BUCKETS)
+
+    def add(self, ms):
+        # bucket 0 holds [0, 1) ms, bucket i holds [g^(i-1), g^i)
+        i = 0 if ms < 1 else min(PING_BUCKETS - 1, int(math.log(ms) / self._log_growth) + 1)
+        self.counts[i] += 1
+
+    def percentile(self, q: float):
+        total = sum(self.counts)
+        if not total:
+            return None
+        target = q * total
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if c and seen >= target:
+                return 0.5 if i == 0 else round(PING_BUCKET_GROWTH ** (i - 0.5), 1)
+        return None
+
+
+class ServerStats:
+    __slots__ = ("checks", "up", "ping_sum", "ping_count", "hist", "peak_players", "peak_at", "last_ts", "last_up")
+
+    def __init__(self):
+        self.checks = 0
+        self.up = 0
+        self.ping_sum = 0
+        self.ping_count = 0
+        self.hist = PingHistogram()
+        self.peak_players = None
+        self.peak_at = None
+        self.last_ts = None
+        self.last_up = None
+
+    def record(self, res: ServerResult):
+        self.checks += 1
+        self.last_ts = res.ts or time.time()
+        self.last_up = res.success
+        if not res.success:
+            return
+        self.up += 1
+        if res.ping is not None:
+            self.ping_sum += res.ping
+            self.ping_count += 1
+            self.hist.add(res.ping)
+        if res.players_online is not None and (self.peak_players is None or res.players_online > self.peak_players):
+            self.peak_players = res.players_online
+            self.peak_at = self.last_ts
+
+    def to_state(self) -> dict:
+        return {k: (list(self.hist.counts) if k == "hist" else getattr(self, k)) for k in self.__slots__}
+
+    @classmethod
+    def from_state(cls, state: dict):
+        st = cls()
+        for k, v in state.items():
+            if k in cls.__slots__:
+                setattr(st, k, PingHistogram(v) if k == "hist" else v)
+        return st
+
+
+def report_state_file(tag: str = None) -> str:
+    """State file per mode, so the GUI and a headless coordinator don't overwrite each other."""
+    if not tag:
+        return REPORT_STATE_FILE
+    safe = "".join(c if c.isalnum() else "_" for c in tag)
+    return REPORT_STATE_FILE[:-len(".json")] + f"_{safe}.json"
+
+
+class ReportEngine:
+    """Per-server running aggregates for uptime/SLA reports.
+
+    record() is O(1) per result, so a report costs O(servers) no matter how
+    many checks went into it. publish() writes the period's HTML and CSV and
+    starts a new period."""
+
+    COLUMNS = ["server", "checks", "uptime_pct", "ping_avg", "ping_p50", "ping_p95", "ping_p99",
+               "peak_players", "peak_at", "last_seen", "last_status"]
+
+    def __init__(self, state_path=REPORT_STATE_FILE, period_hours=REPORT_PERIOD_HOURS):
+        self.state_path = state_path
+        self.period = period_hours * 3600
+        self.period_start = time.time()
+        self.stats = {}
+        self._lock = threading.Lock()
+        try:
+            if state_path and os.path.exists(state_path):
+                state = json.load(open(state_path, "r", encoding="utf-8"))
+                self.period_start = state.get("period_start", self.period_start)
+                self.stats = {h: ServerStats.from_state(v) for h, v in state.get("servers", {}).items()}
+        except Exception:
+            self.stats = {}
+
+    def record(self, res: ServerResult):
+        with self._lock:
+            st = self.stats.get(res.host)
+            if st is None:
+                st = self.stats[res.host] = ServerStats()
+            st.record(res)
+
+    def save(self):
+        with self._lock:
+            state = {"period_start": self.period_start, "servers": {h: st.to_state() for h, st in self.stats.items()}}
+        try:
+            # write-then-rename so a crash mid-save never leaves a truncated state file
+            tmp = self.state_path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp, self.state_path)
+        except Exception as e:
+            print("report state error:", e)
+
+    def due(self) -> bool:
+        return time.time() >= self.period_start + self.period
+
+    def rows(self) -> list:
+        with self._lock:
+            return self._rows(self.stats)
+
+    @staticmethod
+    def _rows(stats) -> list:
+        def ts(v):
+            return datetime.fromtimestamp(v).strftime("%Y-%m-%d %H:%M") if v else ""
+        out = []
+        for host, st in sorted(stats.items()):
+            out.append({
+                "server": host,
+                "checks": st.checks,
+                "uptime_pct": round(100.0 * st.up / st.checks, 2) if st.checks else None,
+                "ping_avg": round(st.ping_sum / st.ping_count, 1) if st.ping_count else None,
+                "ping_p50": st.hist.percentile(0.50),
+                "ping_p95": st.hist.percentile(0.95),
+                "ping_p99": st.hist.percentile(0.99),
+                "peak_players": st.peak_players,
+                "peak_at": ts(st.peak_at),
+                "last_seen": ts(st.last_ts),
+                "last_status": "" if st.last_up is None else ("online" if st.last_up else "offline"),
+            })
+        return out
+
+    def period_label(self, start=None, end=None) -> str:
+        start = start or self.period_start
+        end = end or time.time()
+        return f"{datetime.fromtimestamp(start):%Y-%m-%d %H:%M} — {datetime.fromtimestamp(end):%Y-%m-%d %H:%M}"
+
+    def to_csv(self, rows=None) -> str:
+        buf = io.StringIO()
+        w = csv.DictWriter(buf, fieldnames=self.COLUMNS, lineterminator="\n")
+        w.writeheader()
+        for r in (self.rows() if rows is None else rows):
+            w.writerow({k: "" if v is None else v for k, v in r.items()})
+        return buf.getvalue()
+
+    def to_html(self, rows=None, period_start=None) -> str:
+        rows = self.rows() if rows is None else rows
+        head = "".join(f"<th>{html.escape(c)}</th>" for c in self.COLUMNS)
+        body = "\n".join("<tr>" + "".join(f"<td>{html.escape('' if r[c] is None else str(r[c]))}</td>" for c in self.COLUMNS) + "</tr>" for r in rows)
+        return (f"<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\"><title>{APP_NAME} report</title>"
+                "<style>body{font-family:sans-serif}table{border-collapse:collapse}td,th{border:1px solid #ccc;padding:4px 8px}"
+                "td{text-align:right}td:first-child{text-align:left}</style></head><body>\n"
+                f"<h1>{APP_NAME} uptime report</h1>\n<p>{html.escape(self.period_label(period_start))} · {len(rows)} servers</p>\n"
+                f"<table>\n<tr>{head}</tr>\n{body}\n</table>\n</body></html>\n")
+
+    def publish(self, directory=REPORT_DIR) -> list:
+        """Write this period's report as HTML and CSV, then start a new period."""
+        os.makedirs(directory, exist_ok=True)
+        # close the period atomically: results recorded after this land in the next one
+        with self._lock:
+            stats, start = self.stats, self.period_start
+            self.stats = {}
+            self.period_start = time.time()
+        rows = self._rows(stats)
+        stem = os.path.join(directory, f"report_{datetime.now():%Y%m%d_%H%M%S}")
+        with open(stem + ".html", "w", encoding="utf-8") as f:
+            f.write(self.to_html(rows, start))
+        with open(stem + ".csv", "w", encoding="utf-8", newline="") as f:
+            f.write(self.to_csv(rows))
+        self.save()
+        return [stem + ".html", stem + ".csv"]
+
+
+class FleetCoordinator:
+    """Shards the saved-server list over connected workers and collects their results.
+
+    Workers connect over multiprocessing.connection (authkey challenge, then
+    JSON messages), say hello, then receive {"op": "assign"} messages with
+    their shard and stream results back. A worker
+    that disconnects or stops sending heartbeats is dropped and its servers are
+    redistributed by the ring."""
+
+    def __init__(self, servers, store: ResultStore, listen=FLEET_LISTEN, authkey=FLEET_AUTHKEY,
+                 interval=30, events: EventLog = None, dead_after=FLEET_DEAD_AFTER):
+        self.store = store
+        self.address = parse_listen(listen)
+        self.authkey = authkey.encode("utf-8")
+        self.interval = interval
+        self.events = events
+        self.dead_after = dead_after
+        self.ring = HashRing()
+        self._servers = list(servers)
+        self._workers = {}
+        self._lock = threading.RLock()
+        self._listener = None
+        self._running = False
+
+    def start(self):
+        if self.authkey == FLEET_AUTHKEY.encode("utf-8") and not is_loopback(self.address[0]):
+            raise ValueError("refusing to listen on a non-loopback address with the default fleet authkey")
+        # authentication happens per connection in _serve so a silent client can't stall accept()
+        self._listener = Listener(self.address)
+        self.address = self._listener.address
+        self._running = True
+        threading.Thread(target=self._accept_loop, name="rosemc-fleet-accept", daemon=True).start()
+        threading.Thread(target=self._monitor_loop, name="rosemc-fleet-monitor", daemon=True).start()
+
+    def stop(self):
+        self._running = False
+        with self._lock:
+            for name in list(self._workers):
+                self._send(name, {"op": "stop"})
+                self._drop(name, "coordinator stopped", rebalance=False)
+        try:
+            self._listener.close()
+        except Exception:
+            pass
+
+    def set_servers(self, servers):
+        with self._lock:
+            self._servers = list(servers)
+            self._rebalance()
+
+    def workers(self) -> dict:
+        with self._lock:
+            return {n: {"servers": len(w["shard"]), "last_seen": w["last_seen"]} for n, w in self._workers.items()}
+
+    def _log(self, event, **fields):
+        if self.events:
+            self.events.emit(event, **fields)
+
+    def _accept_loop(self):
+        while self._running:
+            try:
+                conn = self._listener.accept()
+            except Exception:
+                continue
+            threading.Thread(target=self._serve, args=(conn,), name="rosemc-fleet-conn", daemon=True).start()
+
+    def _serve(self, conn):
+        deadline = threading.Timer(FLEET_HELLO_TIMEOUT, _abort_conn, (conn,))
+        deadline.start()
+        try:
+            deliver_challenge(conn, self.authkey)
+            answer_challenge(conn, self.authkey)
+            if not conn.poll(FLEET_HELLO_TIMEOUT):
+                raise TimeoutError("no hello")
+            hello = fleet_recv(conn)
+            if hello.get("op") != "hello":
+                raise ValueError("expected hello")
+        except Exception as e:
+            deadline.cancel()
+            self._log("fleet_reject", reason=f"{type(e).__name__}: {e}")
+            try:
+                conn.close()
+            except Exception:
+                pass
+            return
+        deadline.cancel()
+        name = str(hello.get("name") or f"worker-{id(conn)}")[:100]
+        with self._lock:
+            if name in self._workers:
+                self._drop(name, "replaced", rebalance=False)
+            self._workers[name] = {"conn": conn, "shard": None, "last_seen": time.time()}
+            self.ring.add(name)
+            self._log("fleet_join", worker=name)
+            self._rebalance()
+        self._read_loop(name, conn)
+
+    def _read_loop(self, name, conn):
+        while self._running:
+            try:
+                msg = fleet_recv(conn)
+            except (ValueError, UnicodeDecodeError):
+                continue
+            except Exception:
+                # EOF, reset, or the connection was closed under us by _drop
+                break
+            with self._lock:
+                w = self._workers.get(name)
+                if not w or w["conn"] is not conn:
+                    return
+                w["last_seen"] = time.time()
+            if msg.get("op") == "result" and isinstance(msg.get("result"), dict):
+                res = ServerResult.from_dict(msg["result"])
+                self.store.put(res, worker=name)
+                self._log("result", host=res.host, outcome="online" if res.success else "error", ping=res.ping,
+                          error_class=res.error_class, elapsed_ms=res.elapsed_ms, worker=name)
+        with self._lock:
+            w = self._workers.get(name)
+            if w and w["conn"] is conn:
+                self._drop(name, "disconnected")
+
+    def _monitor_loop(self):
+        while self._running:
+            time.sleep(1.0)
+            now = time.time()
+            with self._lock:
+                for name, w in list(self._workers.items()):
+                    if now - w["last_seen"] > self.dead_after:
+                        self._drop(name, "heartbeat timeout")
+
+    def _drop(self, name, reason, rebalance=True):
+        w = self._workers.pop(name, None)
+        if not w:
+            return
+        self.ring.remove(name)
+        try:
+            w["conn"].close()
+        except Exception:
+            pass
+        self._log("fleet_leave", worker=name, reason=reason)
+        if rebalance:
+            self._rebalance()
+
+    def _rebalance(self):
+        shards = self.ring.shard(self._servers)
+        for name, w in list(self._workers.items()):
+            shard = shards.get(name, [])
+            if shard != w["shard"]:
+                w["shard"] = shard
+                self._send(name, {"op": "assign", "servers": shard, "interval": self.interval})
+
+    def _send(self, name, msg):
+        w = self._workers.get(name)
+        try:
+            fleet_send(w["conn"], msg)
+        except Exception:
+            pass
+
+
+def run_fleet_worker(listen=FLEET_LISTEN, authkey=FLEET_AUTHKEY, name=None, timeout=5, retries=0,
+                     threads=FLEET_WORKER_THREADS):
+    """Headless worker loop: poll the assigned shard and stream results to the coordinator.
+
+    Reconnects if the coordinator goes away; returns when told to stop."""
+    name = name or f"{socket.gethostname()}-{os.getpid()}"
+    while True:
+        try:
+            conn = Client(parse_listen(listen), authkey=authkey.encode("utf-8"))
+        except OSError:
+            time.sleep(FLEET_BEAT_INTERVAL)
+            continue
+        try:
+            fleet_send(conn, {"op": "hello", "name": name})
+            if _fleet_worker_session(conn, timeout, retries, threads):
+                return
+        except (EOFError, OSError, ValueError):
+            pass
+        finally:
+            conn.close()
+        time.sleep(FLEET_BEAT_INTERVAL)
+
+def _fleet_worker_session(conn, timeout, retries, threads) -> bool:
+    # checks run on a fixed pool of daemon threads; this loop only schedules,
+    # forwards results and keeps reading the connection, so assign/stop are
+    # handled within a tick even while slow servers are being checked
+    jobs, results = queue.Queue(), queue.Queue()
+
+    def check_loop():
+        while True:
+            addr = jobs.get()
+            if addr is None:
+                return
+            results.put((addr, check_server(addr, "auto", timeout, retries)))
+
+    pool = [threading.Thread(target=check_loop, name="rosemc-fleet-check", daemon=True) for _ in range(threads)]
+    for t in pool:
+        t.start()
+    sched = PollScheduler(30, max_inflight=threads)
+    last_beat = 0.0
+    try:
+        while True:
+            if conn.poll(AUTO_TICK_MS / 1000):
+                msg = fleet_recv(conn)
+                if msg.get("op") == "stop":
+                    return True
+                if msg.get("op") == "assign":
+                    interval = msg.get("interval")
+                    if isinstance(interval, (int, float)) and interval > 0 and interval != sched.default_interval:
+                        sched.set_interval(interval)
+                    sched.set_servers((a, 0) for a in msg.get("servers", []) if isinstance(a, str))
+            while True:
+                try:
+                    addr, res = results.get_nowait()
+                except queue.Empty:
+                    break
+                sched.done(addr)
+                fleet_send(conn, {"op": "result", "result": res.to_dict()})
+                last_beat = time.time()
+            if time.time() - last_beat >= FLEET_BEAT_INTERVAL:
+                fleet_send(conn, {"op": "beat"})
+                last_beat = time.time()
+            for addr in sched.take():
+                jobs.put(addr)
+    finally:
+        for _ in pool:
+            jobs.put(None)
+
+def run_fleet_coordinator(cfg, listen=FLEET_LISTEN, authkey=FLEET_AUTHKEY, spawn=0, interval=30):
+    events = EventLog()
+    store = ResultStore()
+    reports = ReportEngine(report_state_file("coordinator_" + listen), cfg.get("report_period_hours", REPORT_PERIOD_HOURS))
+    store.subscribe(reports.record)
+    servers = ServerList(cfg.get("history", [])).addrs()
+    coord = FleetCoordinator(servers, store, listen, authkey, interval, events)
+    coord.start()
+    procs = spawn_local_workers(spawn, listen, authkey)
+    print(f"{APP_NAME} coordinator on {listen}, {len(servers)} servers")
+    # SIGTERM unwinds through the finally below like Ctrl-C does
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    seen = 0
+    last_save = time.time()
+    try:
+        while True:
+            time.sleep(5)
+            if time.time() - last_save >= 60:
+                reports.save()
+                last_save = time.time()
+            if store.version != seen:
+                seen = store.version
+                snap = store.snapshot()
+                up = sum(1 for r in snap.values() if r.success)
+                print(f"[{datetime.now().strftime('%H:%M:%S')}] workers={len(coord.workers())} results={len(snap)} online={up}")
+            if reports.due():
+                print("report written:", ", ".join(reports.publish(os.path.join(cfg.get("report_dir", REPORT_DIR), "coordinator"))))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        coord.stop()
+        for p in procs:
+            p.join(2)
+        reports.save()
+        events.close()
+
+def spawn_local_workers(count, listen=FLEET_LISTEN, authkey=FLEET_AUTHKEY) -> list:
+    procs = []
+    for i in range(count):
+        p = multiprocessing.Process(target=run_fleet_worker, args=(listen, authkey, f"local-{os.getpid()}-{i}"), daemon=True)
+        p.start()
+        procs.append(p)
+    return procs
+
 
 class QueryThread(QtCore.QThread):
-    finished = QtCore.pyqtSignal(dict)
-    error = QtCore.pyqtSignal(str)
+    finished = QtCore.pyqtSignal(object)
+    error = QtCore.pyqtSignal(object)
     progress = QtCore.pyqtSignal(int)
 
-    def __init__(self, addr_text: str, server_type: str='auto', timeout: int=5, retries: int=1):
+    def __init__(self, addr_text: str, server_type: str='auto', timeout: int=5, retries: int=1, ping_samples: int=0):
         super().__init__()
         self.addr_text = addr_text.strip()
         self.server_type = server_type
         self.timeout = timeout
         self.retries = retries
+        self.ping_samples = ping_samples
 
     def run(self):
         self.progress.emit(5)
-        try:
-            res = robust_query(self.addr_text, self.server_type, self.timeout, self.retries)
-
-            if ":" in self.addr_text:
-                host, port = self.addr_text.split(":",1)
-            else:
-                host = self.addr_text; port = 25565
-            res["_host"] = f"{host}:{port}"
+        res = check_server(self.addr_text, self.server_type, self.timeout, self.retries, self.ping_samples)
+        if res.success:
             self.progress.emit(100)
             self.finished.emit(res)
-        except Exception as e:
-            self.error.emit(str(e))
+        else:
+            self.error.emit(res)
+
+
+class FingerprintThread(QtCore.QThread):
+    progress = QtCore.pyqtSignal(int, int)
+    finished = QtCore.pyqtSignal(list)
+
+    def __init__(self, addrs, fingerprinter: Fingerprinter, timeout: int=5, events: EventLog = None):
+        super().__init__()
+        self.addrs = list(addrs)
+        self.fingerprinter = fingerprinter
+        self.timeout = timeout
+        self.events = events
+
+    def run(self):
+        out = []
+        for i, addr in enumerate(self.addrs):
+            try:
+                out.append(self.fingerprinter.fingerprint(addr, self.timeout))
+            except Exception as e:
+                # failures stay in the output so the matrix shows what was skipped
+                software = "Unreachable" if isinstance(e, OSError) else "Error"
+                out.append({"_host": normalize_addr(addr), "software": software, "version": "", "protocol": None,
+                            "accepted": [], "error": str(e), "error_class": type(e).__name__})
+                if self.events:
+                    self.events.emit("fingerprint_error", host=normalize_addr(addr), outcome=software.lower(),
+                                     error_class=type(e).__name__, error=str(e))
+            self.progress.emit(i + 1, len(self.addrs))
+        self.fingerprinter.save()
+        self.finished.emit(out)
 
 
 def load_embedded_font():
@@ -206,8 +1576,39 @@ class AboutDialog(QtWidgets.QMessageBox):
         self.setText(text)
         self.setStandardButtons(QtWidgets.QMessageBox.Ok)
 
+class ServerEntryDialog(QtWidgets.QDialog):
+    def __init__(self, entry: ServerEntry = None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Edit server" if entry else "Add server")
+        form = QtWidgets.QFormLayout(self)
+        self.addr_edit = QtWidgets.QLineEdit(entry.addr if entry else "")
+        self.group_edit = QtWidgets.QLineEdit(entry.group if entry else "")
+        self.tags_edit = QtWidgets.QLineEdit(", ".join(entry.tags) if entry else "")
+        self.tags_edit.setPlaceholderText("comma separated")
+        self.notes_edit = QtWidgets.QPlainTextEdit(entry.notes if entry else "")
+        self.notes_edit.setFixedHeight(70)
+        self.interval_spin = QtWidgets.QSpinBox(); self.interval_spin.setRange(0,86400); self.interval_spin.setSuffix(" s")
+        self.interval_spin.setSpecialValueText("default")
+        self.interval_spin.setValue(entry.interval if entry else 0)
+        form.addRow("host[:port]:", self.addr_edit)
+        form.addRow("Group:", self.group_edit)
+        form.addRow("Tags:", self.tags_edit)
+        form.addRow("Auto refresh:", self.interval_spin)
+        form.addRow("Notes:", self.notes_edit)
+        btns = QtWidgets.QDialogButtonBox(QtWidgets.QDialogButtonBox.Ok | QtWidgets.QDialogButtonBox.Cancel)
+        btns.accepted.connect(self.accept)
+        btns.rejected.connect(self.reject)
+        form.addRow(btns)
+
+    def get_entry(self):
+        addr = self.addr_edit.text().strip()
+        if not normalize_addr(addr):
+            return None
+        return ServerEntry(addr, self.tags_edit.text().split(","), self.group_edit.text(), self.notes_edit.toPlainText(),
+                           self.interval_spin.value())
+
 class HistoryManager(QtWidgets.QDialog):
-    def __init__(self, history:list, parent=None):
+    def __init__(self, history: ServerList, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Server List Manager")
         self.resize(480, 360)
@@ -217,7 +1618,8 @@ class HistoryManager(QtWidgets.QDialog):
     def _build_ui(self):
         layout = QtWidgets.QVBoxLayout(self)
         self.listw = QtWidgets.QListWidget()
-        self.listw.addItems(self.history)
+        for entry in self.history:
+            self.listw.addItem(self._make_item(entry))
         layout.addWidget(self.listw)
         row = QtWidgets.QHBoxLayout()
         self.add_btn = QtWidgets.QPushButton("Add")
@@ -235,18 +1637,27 @@ class HistoryManager(QtWidgets.QDialog):
         row.addWidget(self.ok_btn)
         layout.addLayout(row)
 
+    def _make_item(self, entry):
+        it = QtWidgets.QListWidgetItem(entry.label())
+        it.setData(QtCore.Qt.UserRole, entry)
+        it.setToolTip(entry.notes)
+        return it
+
     def add_item(self):
-        text, ok = QtWidgets.QInputDialog.getText(self, "Add server", "host[:port]:")
-        if ok and text:
-            self.listw.insertItem(0, text)
+        dlg = ServerEntryDialog(parent=self)
+        if dlg.exec_() and dlg.get_entry():
+            self.listw.insertItem(0, self._make_item(dlg.get_entry()))
 
     def edit_item(self):
         r = self.listw.currentRow()
         if r < 0: return
         it = self.listw.item(r)
-        text, ok = QtWidgets.QInputDialog.getText(self, "Edit server", "host[:port]:", text=it.text())
-        if ok and text:
-            it.setText(text)
+        dlg = ServerEntryDialog(it.data(QtCore.Qt.UserRole), parent=self)
+        if dlg.exec_() and dlg.get_entry():
+            entry = dlg.get_entry()
+            it.setText(entry.label())
+            it.setData(QtCore.Qt.UserRole, entry)
+            it.setToolTip(entry.notes)
 
     def del_item(self):
         r = self.listw.currentRow()
@@ -254,7 +1665,121 @@ class HistoryManager(QtWidgets.QDialog):
         self.listw.takeItem(r)
 
     def get_history(self):
-        return [self.listw.item(i).text() for i in range(self.listw.count())]
+        return ServerList(self.listw.item(i).data(QtCore.Qt.UserRole) for i in range(self.listw.count()))
+
+class FleetDialog(QtWidgets.QDialog):
+    COLUMNS = ["Server", "Status", "Ping", "Players", "Version", "Worker", "Age"]
+
+    def __init__(self, main_window, parent=None):
+        super().__init__(parent)
+        self.mw = main_window
+        self.setWindowTitle("Fleet")
+        self.resize(820, 480)
+        self._seen = -1
+        self._build_ui()
+        self.timer = QtCore.QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start(1000)
+        self.refresh()
+
+    def _build_ui(self):
+        layout = QtWidgets.QVBoxLayout(self)
+        row = QtWidgets.QHBoxLayout()
+        self.listen_edit = QtWidgets.QLineEdit(self.mw.cfg.get("fleet_listen", FLEET_LISTEN))
+        self.listen_edit.setFixedWidth(200)
+        row.addWidget(QtWidgets.QLabel("Listen:"))
+        row.addWidget(self.listen_edit)
+        self.start_btn = QtWidgets.QPushButton("Start")
+        self.start_btn.clicked.connect(self.on_start_stop)
+        row.addWidget(self.start_btn)
+        self.spawn_spin = QtWidgets.QSpinBox(); self.spawn_spin.setRange(1,32); self.spawn_spin.setValue(2)
+        row.addWidget(self.spawn_spin)
+        self.spawn_btn = QtWidgets.QPushButton("Spawn local workers")
+        self.spawn_btn.clicked.connect(self.on_spawn)
+        row.addWidget(self.spawn_btn)
+        row.addStretch()
+        layout.addLayout(row)
+        self.workers_label = QtWidgets.QLabel("")
+        layout.addWidget(self.workers_label)
+        self.table = QtWidgets.QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        layout.addWidget(self.table)
+
+    def on_start_stop(self):
+        if self.mw.fleet:
+            self.mw.stop_fleet()
+        else:
+            try:
+                self.mw.start_fleet(self.listen_edit.text().strip())
+            except Exception as e:
+                QtWidgets.QMessageBox.critical(self, "Fleet", str(e))
+        self.refresh()
+
+    def on_spawn(self):
+        if not self.mw.fleet:
+            QtWidgets.QMessageBox.information(self, "Fleet", "Start the coordinator first")
+            return
+        self.mw.fleet_procs += spawn_local_workers(int(self.spawn_spin.value()), self.mw.cfg.get("fleet_listen", FLEET_LISTEN),
+                                                  fleet_authkey(self.mw.cfg))
+
+    def refresh(self):
+        fleet = self.mw.fleet
+        self.start_btn.setText("Stop" if fleet else "Start")
+        if fleet:
+            ws = fleet.workers()
+            self.workers_label.setText(f"{len(ws)} workers: " + ", ".join(f"{n} ({w['servers']})" for n, w in sorted(ws.items())))
+        else:
+            self.workers_label.setText("Coordinator stopped")
+        store = self.mw.store
+        if store.version == self._seen:
+            return
+        self._seen = store.version
+        snap = store.snapshot()
+        now = time.time()
+        self.table.setRowCount(len(snap))
+        for r, (host, res) in enumerate(sorted(snap.items())):
+            po = res.players_online; pm = res.players_max
+            cells = [host, "Online" if res.success else (res.error_class or "Error"),
+                     f"{res.ping} ms" if res.success else "-",
+                     f"{po if po is not None else '?'} / {pm if pm is not None else '?'}" if res.success else "-",
+                     res.version, res.worker or "local", f"{int(now - (res.ts or now))} s"]
+            for c, text in enumerate(cells):
+                self.table.setItem(r, c, QtWidgets.QTableWidgetItem(str(text)))
+
+    def closeEvent(self, event):
+        self.timer.stop()
+        super().closeEvent(event)
+
+class VersionMatrixDialog(QtWidgets.QDialog):
+    def __init__(self, fingerprints, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Version matrix")
+        self.resize(900, 420)
+        self.matrix = version_matrix(fingerprints)
+        protos = self.matrix["protocols"]
+        layout = QtWidgets.QVBoxLayout(self)
+        failed = sum(1 for fp in fingerprints if fp.get("error_class"))
+        layout.addWidget(QtWidgets.QLabel(f"{len(fingerprints) - failed} servers fingerprinted, {failed} failed — "
+                                          "cells count servers accepting each protocol"))
+        table = QtWidgets.QTableWidget(len(self.matrix["rows"]), 3 + len(protos))
+        table.setHorizontalHeaderLabels(["Software", "Version", "Servers"] + [f"{PROBE_PROTOCOLS.get(p, '')} ({p})".strip() for p in protos])
+        table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        for r, row in enumerate(self.matrix["rows"]):
+            cells = [row["software"], row["version"], row["servers"]] + [row["accepts"][p] or "" for p in protos]
+            for c, v in enumerate(cells):
+                table.setItem(r, c, QtWidgets.QTableWidgetItem(str(v)))
+        layout.addWidget(table)
+        btns = QtWidgets.QHBoxLayout()
+        btns.addStretch()
+        copy_btn = QtWidgets.QPushButton("Copy")
+        copy_btn.clicked.connect(lambda: QtWidgets.QApplication.clipboard().setText(format_version_matrix(self.matrix)))
+        btns.addWidget(copy_btn)
+        ok_btn = QtWidgets.QPushButton("OK")
+        ok_btn.clicked.connect(self.accept)
+        btns.addWidget(ok_btn)
+        layout.addLayout(btns)
 
 class LoginDialog(QtWidgets.QDialog):
     def __init__(self, cfg, font_family):
@@ -423,19 +1948,43 @@ class MainWindow(QtWidgets.QMainWindow):
         super().__init__()
         self.cfg = cfg
         self.font_family = font_family
-        self.history = cfg.get("history", [])
+        self.history = ServerList(cfg.get("history", []))
+        self._hist_items = {}
+        self._filter_query = ""
+        self._filter_hits = None
         self.setWindowTitle(APP_NAME)
         self.resize(1100, 720)
         # frameless & translucent to remove white chrome
         self.setWindowFlags(QtCore.Qt.FramelessWindowHint)
         self.setAttribute(QtCore.Qt.WA_TranslucentBackground)
         self.worker = None
+        self.scheduler = None
+        self._auto_extra = None
+        self.poll_workers = []
+        self.events = EventLog()
+        self.store = ResultStore()
+        self.reports = ReportEngine(period_hours=cfg.get("report_period_hours", REPORT_PERIOD_HOURS))
+        self.store.subscribe(self.reports.record)
+        self.fleet = None
+        self.fleet_procs = []
+        self.fingerprinter = Fingerprinter()
+        self.fp_worker = None
         self.current_result = None
         self.prev_online = None
         self._build_ui()
         self._apply_style()
         self.auto_timer = QtCore.QTimer(self)
         self.auto_timer.timeout.connect(self._auto_refresh_tick)
+        self.interval_timer = QtCore.QTimer(self)
+        self.interval_timer.setSingleShot(True)
+        self.interval_timer.timeout.connect(self._apply_auto_interval)
+        self.report_timer = QtCore.QTimer(self)
+        self.report_timer.timeout.connect(self._report_tick)
+        self.report_timer.start(60 * 1000)
+        self._log_seq = 0
+        self.log_timer = QtCore.QTimer(self)
+        self.log_timer.timeout.connect(self._refresh_log)
+        self.log_timer.start(500)
 
     def _build_ui(self):
         central_bg = QtWidgets.QFrame()
@@ -451,6 +2000,12 @@ class MainWindow(QtWidgets.QMainWindow):
         self.about_btn = QtWidgets.QPushButton("About")
         self.about_btn.clicked.connect(self.on_about)
         header.addWidget(self.about_btn)
+        self.report_btn = QtWidgets.QPushButton("Report")
+        self.report_btn.clicked.connect(self.on_report)
+        header.addWidget(self.report_btn)
+        self.fleet_btn = QtWidgets.QPushButton("Fleet")
+        self.fleet_btn.clicked.connect(self.open_fleet)
+        header.addWidget(self.fleet_btn)
         self.theme_btn = QtWidgets.QPushButton("Theme")
         self.theme_btn.clicked.connect(self.on_toggle_theme)
         header.addWidget(self.theme_btn)
@@ -464,9 +2019,9 @@ class MainWindow(QtWidgets.QMainWindow):
         self.addr_combo = QtWidgets.QComboBox()
         self.addr_combo.setEditable(True)
         self.addr_combo.setFixedWidth(420)
-        for it in self.history:
-            self.addr_combo.addItem(it)
+        self.addr_combo.addItems(self.history.addrs())
         self.addr_combo.setFont(QtGui.QFont(self.font_family, 11))
+        self.addr_combo.editTextChanged.connect(self._sync_auto_extra)
         row.addWidget(self.addr_combo)
 
         self.type_cb = QtWidgets.QComboBox()
@@ -478,6 +2033,9 @@ class MainWindow(QtWidgets.QMainWindow):
         row.addWidget(self.timeout_spin)
         self.retries_spin = QtWidgets.QSpinBox(); self.retries_spin.setRange(0,5); self.retries_spin.setValue(1); self.retries_spin.setSuffix(" r"); self.retries_spin.setFixedWidth(90)
         row.addWidget(self.retries_spin)
+        self.samples_spin = QtWidgets.QSpinBox(); self.samples_spin.setRange(0,20); self.samples_spin.setValue(0); self.samples_spin.setSuffix(" pings"); self.samples_spin.setFixedWidth(110)
+        self.samples_spin.setToolTip("Extra ping/pong samples sent on the same connection")
+        row.addWidget(self.samples_spin)
 
         self.check_btn = QtWidgets.QPushButton("Check")
         self.check_btn.clicked.connect(self.on_check)
@@ -488,6 +2046,7 @@ class MainWindow(QtWidgets.QMainWindow):
         row.addWidget(self.auto_chk)
 
         self.auto_interval = QtWidgets.QSpinBox(); self.auto_interval.setRange(5,3600); self.auto_interval.setValue(30); self.auto_interval.setSuffix(" s"); self.auto_interval.setFixedWidth(100)
+        self.auto_interval.valueChanged.connect(self.on_auto_interval_changed)
         row.addWidget(self.auto_interval)
 
         main.addLayout(row)
@@ -559,8 +2118,14 @@ class MainWindow(QtWidgets.QMainWindow):
 
         right_v = QtWidgets.QVBoxLayout()
         right_v.addWidget(QtWidgets.QLabel("Saved servers:"))
+        self.filter_edit = QtWidgets.QLineEdit()
+        self.filter_edit.setPlaceholderText("Filter: host prefix, #tag, group:name")
+        self.filter_edit.setClearButtonEnabled(True)
+        self.filter_edit.textChanged.connect(self.on_filter_changed)
+        right_v.addWidget(self.filter_edit)
         self.history_list = QtWidgets.QListWidget()
-        self.history_list.addItems(self.history)
+        self.history_list.setUniformItemSizes(True)
+        self._fill_history_list()
         self.history_list.itemDoubleClicked.connect(self.on_history_activate)
         right_v.addWidget(self.history_list)
 
@@ -568,6 +2133,10 @@ class MainWindow(QtWidgets.QMainWindow):
         self.manage_hist_btn = QtWidgets.QPushButton("Manage")
         self.manage_hist_btn.clicked.connect(self.open_history_manager)
         hist_btns.addWidget(self.manage_hist_btn)
+        self.fp_btn = QtWidgets.QPushButton("Fingerprint")
+        self.fp_btn.setToolTip("Detect software and accepted protocols of the listed servers")
+        self.fp_btn.clicked.connect(self.on_fingerprint)
+        hist_btns.addWidget(self.fp_btn)
         self.clear_hist_btn = QtWidgets.QPushButton("Clear All")
         self.clear_hist_btn.clicked.connect(self.clear_history)
         hist_btns.addWidget(self.clear_hist_btn)
@@ -575,6 +2144,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
         right_v.addWidget(QtWidgets.QLabel("Log:"))
         self.log_text = QtWidgets.QTextEdit(); self.log_text.setReadOnly(True); self.log_text.setFixedHeight(220)
+        self.log_text.document().setMaximumBlockCount(LOG_VIEW_LIMIT)
         right_v.addWidget(self.log_text)
 
         content.addLayout(right_v, 1)
@@ -586,6 +2156,8 @@ class MainWindow(QtWidgets.QMainWindow):
         self.last_label = QtWidgets.QLabel("")
         footer.addWidget(self.last_label)
         footer.addStretch(1)
+        self.rate_label = QtWidgets.QLabel("")
+        footer.addWidget(self.rate_label)
         main.addLayout(footer)
 
     def _apply_style(self):
@@ -606,8 +2178,13 @@ class MainWindow(QtWidgets.QMainWindow):
         c = colors.get(color, '#7b8a7b')
         self.led.setStyleSheet(f"background:{c}; border-radius:8px; min-width:16px; min-height:16px;")
 
-    def log(self, s):
-        self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] {s}")
+    def log(self, s, event="message", **fields):
+        self.events.emit(event, msg=s, **fields)
+
+    def _refresh_log(self):
+        self._log_seq, recs = self.events.since(self._log_seq)
+        for rec in recs:
+            self.log_text.append(format_event(rec))
 
 
     def on_check(self):
@@ -618,8 +2195,10 @@ class MainWindow(QtWidgets.QMainWindow):
 
         timeout = int(self.timeout_spin.value())
         retries = int(self.retries_spin.value())
+        samples = int(self.samples_spin.value())
         stype = self.type_cb.currentText()
-        self.log(f"Querying {addr} (timeout={timeout}s retries={retries})")
+        self.log(f"Querying {addr} (timeout={timeout}s retries={retries} samples={samples})",
+                 "query", host=addr, timeout=timeout, retries=retries, samples=samples)
         self.status_big.setText("Querying...")
         self._led('yellow')
         self.player_list.clear()
@@ -628,23 +2207,29 @@ class MainWindow(QtWidgets.QMainWindow):
         self.ping_label.setText("Ping: -")
         self.players_label.setText("Players: - / -")
         self.check_btn.setEnabled(False)
-        self.worker = QueryThread(addr, stype, timeout, retries)
+        self.worker = QueryThread(addr, stype, timeout, retries, samples)
         self.worker.progress.connect(lambda v: self.status_big.setText(f"Querying... {v}%"))
         self.worker.finished.connect(self._on_finished)
         self.worker.error.connect(self._on_error)
         self.worker.start()
 
-    def _on_finished(self, res):
-        self.check_btn.setEnabled(True)
+    def _on_finished(self, res, manual=True):
+        if manual:
+            self.check_btn.setEnabled(True)
         self.current_result = res
+        self.store.put(res)
         self._led('green')
         self.status_big.setText("Online")
-        self.ping_label.setText(f"Ping: {res.get('ping','?')} ms")
-        self.version_label.setText(f"Version: {res.get('version','-')}")
-        po = res.get('players_online'); pm = res.get('players_max')
+        if res.samples:
+            st = res.ping_stats()
+            self.ping_label.setText(f"Ping: {st['ping_min']} ms (avg {st['ping_avg']} / jitter {format_jitter(st['ping_jitter'])}, n={len(res.samples)})")
+        else:
+            self.ping_label.setText(f"Ping: {res.ping if res.ping is not None else '?'} ms")
+        self.version_label.setText(f"Version: {res.version or '-'}")
+        po = res.players_online; pm = res.players_max
         self.players_label.setText(f"Players: {po if po is not None else '?'} / {pm if pm is not None else '?'}")
-        self.motd_text.setPlainText(str(res.get('motd','')) + "\n\nRAW:\n" + str(res.get('raw',''))[:3000])
-        sample = res.get('sample') or []
+        self.motd_text.setPlainText(str(res.motd) + "\n\nRAW:\n" + res.raw[:3000])
+        sample = res.sample
         self.player_list.clear()
         if sample:
             for s in sample:
@@ -652,15 +2237,12 @@ class MainWindow(QtWidgets.QMainWindow):
         else:
             self.player_list.addItem("(no sample)")
 
-        entry = res.get('_host')
+        entry = res.host
         if entry and entry not in self.history:
-            self.history.insert(0, entry)
-            if len(self.history) > HISTORY_LIMIT:
-                self.history = self.history[:HISTORY_LIMIT]
-            self.history_list.insertItem(0, entry)
-            self.addr_combo.insertItem(0, entry)
-            self.cfg["history"] = self.history
-            save_config(self.cfg)
+            self._add_history_entry(ServerEntry(entry))
+            for addr in self.history.trim(HISTORY_LIMIT):
+                self._drop_history_item(addr)
+            self._history_changed()
         self.last_label.setText("Last: " + datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
 
         online_now = True
@@ -669,16 +2251,20 @@ class MainWindow(QtWidgets.QMainWindow):
         else:
             if online_now != self.prev_online:
 
-                QtWidgets.QMessageBox.information(self, APP_NAME, f"Server {res.get('_host')} changed status: Online")
+                QtWidgets.QMessageBox.information(self, APP_NAME, f"Server {res.host} changed status: Online")
             self.prev_online = online_now
-        self.log(f"Success: {res.get('_host')} ping={res.get('ping')}ms")
+        self.log(f"Success: {res.host} ping={res.ping}ms", "result", host=res.host, outcome="online",
+                 ping=res.ping, ping_avg=res.ping_stats().get('ping_avg'), elapsed_ms=res.elapsed_ms)
 
-    def _on_error(self, err):
-        self.check_btn.setEnabled(True)
+    def _on_error(self, err, manual=True):
+        if manual:
+            self.check_btn.setEnabled(True)
+        self.store.put(err)
         self._led('red')
         self.status_big.setText("Offline / Error")
-        self.motd_text.setPlainText("Error:\n" + str(err))
-        self.log("Error: " + str(err))
+        self.motd_text.setPlainText("Error:\n" + str(err.error))
+        self.log("Error: " + str(err.error), "result", host=err.host, outcome="error",
+                 error_class=err.error_class, error=err.error, elapsed_ms=err.elapsed_ms)
         online_now = False
         if self.prev_online is None:
             self.prev_online = online_now
@@ -691,54 +2277,116 @@ class MainWindow(QtWidgets.QMainWindow):
     def save_current_to_history(self):
         addr = self.addr_combo.currentText().strip()
         if not addr: return
+        if not normalize_addr(addr):
+            QtWidgets.QMessageBox.warning(self, "History", f"Invalid address: {addr}")
+            return
         if addr in self.history:
             QtWidgets.QMessageBox.information(self, "History", "Already saved")
             return
-        self.history.insert(0, addr)
-        self.history_list.insertItem(0, addr)
-        self.addr_combo.insertItem(0, addr)
-        self.cfg["history"] = self.history
-        save_config(self.cfg)
+        self._add_history_entry(ServerEntry(addr))
+        self._history_changed()
         QtWidgets.QMessageBox.information(self, "History", "Saved")
 
     def on_history_activate(self, item):
         if not item: return
-        self.addr_combo.setEditText(item.text())
+        self.addr_combo.setEditText(item.data(QtCore.Qt.UserRole))
         self.on_check()
 
     def open_history_manager(self):
         dlg = HistoryManager(self.history, parent=self)
         if dlg.exec_():
             self.history = dlg.get_history()
-            self.history_list.clear()
-            self.history_list.addItems(self.history)
+            self._fill_history_list()
             self.addr_combo.clear()
-            self.addr_combo.addItems(self.history)
-            self.cfg["history"] = self.history
-            save_config(self.cfg)
+            self.addr_combo.addItems(self.history.addrs())
+            self._history_changed()
 
     def clear_history(self):
         if QtWidgets.QMessageBox.question(self, "Clear history", "Clear all saved servers?") != QtWidgets.QMessageBox.Yes:
             return
-        self.history = []
-        self.history_list.clear()
+        self.history.clear()
+        self._fill_history_list()
         self.addr_combo.clear()
-        self.cfg["history"] = []
-        save_config(self.cfg)
+        self._history_changed()
 
     def del_hist_item(self):
         row = self.history_list.currentRow()
         if row < 0: return
-        it = self.history_list.takeItem(row)
+        it = self.history_list.item(row)
         if it:
-            txt = it.text()
-            try:
-                self.history.remove(txt)
-            except:
-                pass
-            self.cfg["history"] = self.history
-            save_config(self.cfg)
+            addr = it.data(QtCore.Qt.UserRole)
+            self.history.remove(addr)
+            self._drop_history_item(addr)
+            self._history_changed()
 
+    def _history_changed(self):
+        self.cfg["history"] = self.history.to_config()
+        save_config(self.cfg)
+        if self.fleet:
+            self.fleet.set_servers(self.history.addrs())
+        if self.scheduler:
+            self.scheduler.set_servers(self._auto_servers())
+
+    def _make_history_item(self, entry):
+        it = QtWidgets.QListWidgetItem(entry.label())
+        it.setData(QtCore.Qt.UserRole, entry.addr)
+        if entry.notes:
+            it.setToolTip(entry.notes)
+        self._hist_items[entry.addr] = it
+        return it
+
+    def _fill_history_list(self):
+        self.history_list.clear()
+        self._hist_items = {}
+        for entry in self.history:
+            self.history_list.addItem(self._make_history_item(entry))
+        self._filter_query = ""
+        self._filter_hits = None
+        self.on_filter_changed(self.filter_edit.text())
+
+    def _add_history_entry(self, entry):
+        if not self.history.add(entry):
+            return
+        it = self._make_history_item(entry)
+        self.history_list.insertItem(0, it)
+        self.addr_combo.insertItem(0, entry.addr)
+        if self._filter_hits is not None:
+            if self.history.search(self._filter_query, {entry.addr}):
+                self._filter_hits.add(entry.addr)
+            else:
+                it.setHidden(True)
+
+    def _drop_history_item(self, addr):
+        it = self._hist_items.pop(addr, None)
+        if it is not None:
+            self.history_list.takeItem(self.history_list.row(it))
+        i = self.addr_combo.findText(addr)
+        if i >= 0:
+            self.addr_combo.removeItem(i)
+        if self._filter_hits is not None:
+            self._filter_hits.discard(addr)
+
+    def on_filter_changed(self, text):
+        query = text.strip().lower()
+        prev_q, prev = self._filter_query, self._filter_hits
+        # typing more characters can only narrow the hit set, so refine it instead of hitting the index
+        within = prev if prev is not None and ServerList.narrows(prev_q, query) else None
+        hits = self.history.search(query, within)
+        self._filter_query, self._filter_hits = query, hits
+        if prev is None and hits is None:
+            return
+        if prev is None:
+            hidden, shown = [a for a in self._hist_items if a not in hits], ()
+        elif hits is None:
+            hidden, shown = (), [a for a in self._hist_items if a not in prev]
+        else:
+            # only items whose visibility changes are touched, whether the query narrowed, widened or was edited
+            hidden, shown = prev - hits, hits - prev
+        for addrs, hide in ((hidden, True), (shown, False)):
+            for addr in addrs:
+                it = self._hist_items.get(addr)
+                if it is not None:
+                    it.setHidden(hide)
 
     def export_json(self):
         if not self.current_result:
@@ -749,7 +2397,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if not path: return
         try:
             with open(path, "w", encoding="utf-8") as f:
-                json.dump({"checked_at": datetime.now().isoformat(), "server": self.current_result.get("_host"), "result": self.current_result}, f, ensure_ascii=False, indent=2)
+                json.dump({"checked_at": datetime.now().isoformat(), "server": self.current_result.host, "result": self.current_result.to_dict()}, f, ensure_ascii=False, indent=2)
             QtWidgets.QMessageBox.information(self, "Export", "Saved.")
         except Exception as e:
             QtWidgets.QMessageBox.critical(self, "Error", str(e))
@@ -770,36 +2418,170 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _format_result_text(self, res):
         if not res: return ""
+        res = res.to_dict()
         lines = []
         lines.append(f"Server: {res.get('_host','')}")
         lines.append(f"Type: {res.get('type','')}")
         lines.append(f"Ping: {res.get('ping','?')} ms")
+        if res.get('ping_samples'):
+            lines.append(f"Latency: min {res.get('ping_min')} / avg {res.get('ping_avg')} ms / jitter {format_jitter(res.get('ping_jitter'))} ({len(res['ping_samples'])} samples)")
         lines.append(f"Version: {res.get('version','')}")
         lines.append(f"Players: {res.get('players_online','?')} / {res.get('players_max','?')}")
         lines.append("MOTD:")
         lines.append(str(res.get('motd','')))
         return "\n".join(lines)
 
+    def on_report(self):
+        default = f"rosemc_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
+        path, flt = QtWidgets.QFileDialog.getSaveFileName(self, "Export report", default, "HTML files (*.html);;CSV files (*.csv)")
+        if not path: return
+        try:
+            as_csv = path.lower().endswith(".csv") or (flt.startswith("CSV") and not path.lower().endswith(".html"))
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                f.write(self.reports.to_csv() if as_csv else self.reports.to_html())
+            QtWidgets.QMessageBox.information(self, "Report", "Saved.")
+        except Exception as e:
+            QtWidgets.QMessageBox.critical(self, "Error", str(e))
+
+    def _report_tick(self):
+        if not self.reports.due():
+            self.reports.save()
+            return
+        try:
+            paths = self.reports.publish(self.cfg.get("report_dir", REPORT_DIR))
+            self.log("Scheduled report written: " + paths[0], "report", paths=paths)
+        except Exception as e:
+            self.log("Scheduled report failed: " + str(e), "report", error_class=type(e).__name__, error=str(e))
+
     def copy_result(self):
         if not self.current_result:
             return
-        QtWidgets.QApplication.clipboard().setText(json.dumps(self.current_result, ensure_ascii=False, indent=2))
+        QtWidgets.QApplication.clipboard().setText(json.dumps(self.current_result.to_dict(), ensure_ascii=False, indent=2))
         QtWidgets.QMessageBox.information(self, "Copied", "Result copied to clipboard")
 
 
+    def _auto_servers(self):
+        servers = [(e.addr, e.interval) for e in self.history]
+        addr = self.addr_combo.currentText().strip()
+        self._auto_extra = None
+        if addr and addr not in self.history:
+            self._auto_extra = normalize_addr(addr)
+            servers.append((self._auto_extra, 0))
+        return servers
+
+    def _sync_auto_extra(self, text=None):
+        """Keep an unsaved address typed into the combo box in the auto-refresh schedule."""
+        if not self.scheduler:
+            return
+        text = self.addr_combo.currentText().strip()
+        extra = normalize_addr(text) if text and text not in self.history else None
+        if extra == self._auto_extra:
+            return
+        if self._auto_extra and self._auto_extra not in self.history:
+            self.scheduler.discard(self._auto_extra)
+        self._auto_extra = extra
+        if extra:
+            # wait for typing to settle; a newer edit discards this entry first
+            self.scheduler.add(extra, 0, AUTO_EDIT_DELAY)
+
     def on_auto_changed(self, state):
         if state == QtCore.Qt.Checked:
-            interval = int(self.auto_interval.value()) * 1000
-            self.auto_timer.start(interval)
-            self.log("Auto-refresh enabled")
+            interval = int(self.auto_interval.value())
+            self.scheduler = PollScheduler(interval, float(self.cfg.get("auto_max_rate", 0)))
+            self.scheduler.set_servers(self._auto_servers())
+            self.auto_timer.start(AUTO_TICK_MS)
+            self.log(f"Auto-refresh enabled for {len(self.scheduler)} servers", "auto_refresh", enabled=True,
+                     interval=interval, servers=len(self.scheduler), target_rate=round(self.scheduler.target_rate(), 3))
         else:
             self.auto_timer.stop()
-            self.log("Auto-refresh disabled")
+            self.scheduler = None
+            self.rate_label.setText("")
+            self.log("Auto-refresh disabled", "auto_refresh", enabled=False)
+
+    def on_auto_interval_changed(self, value):
+        # spinbox steps arrive in bursts; re-stagger once the value settles
+        self.interval_timer.start(500)
+
+    def _apply_auto_interval(self):
+        if self.scheduler:
+            self.scheduler.set_interval(int(self.auto_interval.value()))
 
     def _auto_refresh_tick(self):
-        addr = self.addr_combo.currentText().strip()
-        if addr:
-            self.on_check()
+        sched = self.scheduler
+        if not sched:
+            return
+        self.poll_workers = [w for w in self.poll_workers if not w.isFinished()]
+        timeout = int(self.timeout_spin.value())
+        retries = int(self.retries_spin.value())
+        samples = int(self.samples_spin.value())
+        stype = self.type_cb.currentText()
+        for addr in sched.take():
+            w = QueryThread(addr, stype, timeout, retries, samples)
+            w.finished.connect(self._on_poll_done)
+            w.error.connect(self._on_poll_done)
+            self.poll_workers.append(w)
+            w.start()
+        self.rate_label.setText(f"Auto: {sched.achieved_rate():.2f}/s of {sched.target_rate():.2f}/s target · "
+                                f"{len(sched.in_flight)} in flight · {sched.skipped} skipped")
+
+    def _on_poll_done(self, res):
+        if self.scheduler:
+            self.scheduler.done(res.host)
+        # the server on screen gets the full treatment; the rest just feed the store
+        if res.host == normalize_addr(self.addr_combo.currentText()):
+            (self._on_finished if res.success else self._on_error)(res, manual=False)
+            return
+        self.store.put(res)
+        self.events.emit("result", host=res.host, outcome="online" if res.success else "error", ping=res.ping,
+                         error_class=res.error_class, elapsed_ms=res.elapsed_ms, auto=True)
+
+    def on_fingerprint(self):
+        if self.fp_worker and self.fp_worker.isRunning():
+            return
+        # fingerprint what the filter currently shows
+        addrs = self.history.addrs() if self._filter_hits is None else [a for a in self.history.addrs() if a in self._filter_hits]
+        if not addrs:
+            QtWidgets.QMessageBox.information(self, "Fingerprint", "No servers to fingerprint")
+            return
+        self.fp_btn.setEnabled(False)
+        self.log(f"Fingerprinting {len(addrs)} servers", "fingerprint", servers=len(addrs))
+        self.fp_worker = FingerprintThread(addrs, self.fingerprinter, int(self.timeout_spin.value()), self.events)
+        self.fp_worker.progress.connect(lambda i, n: self.fp_btn.setText(f"Fingerprint {i}/{n}"))
+        self.fp_worker.finished.connect(self._on_fingerprints)
+        self.fp_worker.start()
+
+    def _on_fingerprints(self, fps):
+        self.fp_btn.setEnabled(True)
+        self.fp_btn.setText("Fingerprint")
+        failed = sum(1 for fp in fps if fp.get("error_class"))
+        self.log(f"Fingerprinted {len(fps) - failed} servers ({failed} failed)", "fingerprint_done",
+                 servers=len(fps) - failed, failed=failed)
+        VersionMatrixDialog(fps, parent=self).exec_()
+
+    def open_fleet(self):
+        FleetDialog(self, parent=self).exec_()
+
+    def start_fleet(self, listen):
+        self.cfg["fleet_listen"] = listen
+        save_config(self.cfg)
+        self.fleet = FleetCoordinator(self.history.addrs(), self.store, listen, fleet_authkey(self.cfg),
+                                      int(self.auto_interval.value()), self.events)
+        try:
+            self.fleet.start()
+        except Exception:
+            self.fleet = None
+            raise
+        self.log(f"Fleet coordinator listening on {listen}", "fleet_start", listen=listen)
+
+    def stop_fleet(self):
+        if not self.fleet:
+            return
+        self.fleet.stop()
+        self.fleet = None
+        for p in self.fleet_procs:
+            p.join(2)
+        self.fleet_procs = []
+        self.log("Fleet coordinator stopped", "fleet_stop")
 
     def on_about(self):
         dlg = AboutDialog(self)
@@ -814,8 +2596,28 @@ class MainWindow(QtWidgets.QMainWindow):
         QtWidgets.QMessageBox.information(self, "Theme", "Theme toggled (restart may be required for full effect).")
 
 
+def parse_args(argv):
+    ap = argparse.ArgumentParser(prog=APP_NAME)
+    ap.add_argument("--worker", metavar="HOST:PORT", help="run as a headless fleet worker for the coordinator at HOST:PORT")
+    ap.add_argument("--coordinator", action="store_true", help="run a headless fleet coordinator over the saved servers")
+    ap.add_argument("--listen", default=None, help=f"coordinator listen address (default {FLEET_LISTEN})")
+    ap.add_argument("--spawn", type=int, default=0, help="local worker processes to start with --coordinator")
+    ap.add_argument("--interval", type=int, default=30, help="poll interval in seconds for fleet workers")
+    ap.add_argument("--authkey", default=None, help="shared fleet secret (default: fleet_authkey from the config)")
+    return ap.parse_known_args(argv)[0]
+
 def main():
+    multiprocessing.freeze_support()
     cfg = load_config()
+    args = parse_args(sys.argv[1:])
+    if args.worker or args.coordinator:
+        authkey = args.authkey or fleet_authkey(cfg)
+    if args.worker:
+        run_fleet_worker(args.worker, authkey)
+        return
+    if args.coordinator:
+        run_fleet_coordinator(cfg, args.listen or cfg.get("fleet_listen", FLEET_LISTEN), authkey, args.spawn, args.interval)
+        return
     app = QtWidgets.QApplication(sys.argv)
 
 
@@ -828,8 +2630,11 @@ def main():
         return
 
     w = MainWindow(cfg, font_family)
+    app.aboutToQuit.connect(w.stop_fleet)
+    app.aboutToQuit.connect(w.reports.save)
+    app.aboutToQuit.connect(w.events.close)
     w.show()
     sys.exit(app.exec_())
 
 if __name__ == "__main__":
-    main()  
\ No newline at end of file
+    main()  
\ No newline at end of file